@@ -1,18 +1,30 @@
 import discord
 from discord.ext import commands
 import asyncio
-from copy import deepcopy
-from typing import List, Tuple
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from .abc import Dialog
 
 
+_EMPTY = discord.Embed.Empty
+
+
 class EmbedPaginator(Dialog):
     """ Represents an interactive menu containing multiple embeds. """
 
     def __init__(
         self,
         client: discord.Client,
-        pages: [discord.Embed],
+        pages: Sequence[discord.Embed],
         message: discord.Message = None,
         *,
         control_emojis: Tuple[str, str, str, str, str] = None,
@@ -21,7 +33,7 @@ class EmbedPaginator(Dialog):
         Initialize a new EmbedPaginator.
 
         :param client: The :class:`discord.Client` to use.
-        :param pages: A list of :class:`discord.Embed` to paginate through.
+        :param pages: A sequence of :class:`discord.Embed` to paginate through.
         :param message: An optional :class:`discord.Message` to edit.
             Otherwise a new message will be sent.
         :param control_emojis: An option :class:`typing.Tuple` of control emojis to use,
@@ -30,39 +42,100 @@ class EmbedPaginator(Dialog):
         super().__init__()
 
         self._client = client
+        self._formatted_pages: Optional[Tuple[discord.Embed, ...]] = None
         self.pages = pages
         self.message = message
 
         self.control_emojis = control_emojis or ("⏮", "◀", "▶", "⏭", "⏹")
 
     @property
-    def formatted_pages(self) -> List[discord.Embed]:
-        """ The embeds with formatted footers to act as pages. """
+    def control_emojis(self) -> Tuple[str, str, str, str, str]:
+        """ The emojis for the first, previous, next and last page and to stop. """
+
+        return self._control_emojis
+
+    @control_emojis.setter
+    def control_emojis(self, control_emojis: Tuple[str, str, str, str, str]):
+        self._control_emojis = control_emojis
+
+        # raw reaction events carry a PartialEmoji, so emojis are compared as str
+        first, prev, next_, last, stop = map(str, control_emojis)
+        self._deltas = {
+            first: lambda cur, mx: 0,
+            prev: lambda cur, mx: max(0, cur - 1),
+            next_: lambda cur, mx: min(mx, cur + 1),
+            last: lambda cur, mx: mx,
+        }
+        self._stop_emoji = stop
+        self._control_emoji_set = frozenset((*self._deltas, stop))
 
-        pages = deepcopy(self.pages)  # copy by value not reference
-        for page in pages:
-            if page.footer.text == discord.Embed.Empty:
-                page.set_footer(text=f"({pages.index(page)+1}/{len(pages)})")
-            else:
-                page_index = pages.index(page)
-                if page.footer.icon_url == discord.Embed.Empty:
-                    page.set_footer(
-                        text=f"{page.footer.text} - ({page_index+1}/{len(pages)})"
-                    )
-                else:
-                    page.set_footer(
-                        icon_url=page.footer.icon_url,
-                        text=f"{page.footer.text} - ({page_index+1}/{len(pages)})",
-                    )
-        return pages
-
-    async def run(self, users: List[discord.User], channel: discord.TextChannel = None, timeout = 100):
+    @property
+    def pages(self) -> Tuple[discord.Embed, ...]:
+        """
+        The embeds to paginate through.
+
+        Changes made to a page embed in place after :attr:`formatted_pages` has been
+        built are not picked up. Assign a new sequence to ``pages`` instead.
+        """
+
+        return self._pages
+
+    @pages.setter
+    def pages(self, pages: Sequence[discord.Embed]):
+        # stored as a tuple so the formatted pages can't get out of sync
+        self._pages = tuple(pages)
+        self._formatted_pages = None
+
+    @property
+    def formatted_pages(self) -> Tuple[discord.Embed, ...]:
+        """
+        The embeds with formatted footers to act as pages.
+
+        They are built once and cached until ``pages`` is reassigned, so changing a
+        page embed in place afterwards is not reflected here. Pages whose footer
+        already ends with their page counter are the same objects as in ``pages``.
+        """
+
+        return self._get_formatted_pages()
+
+    def _get_formatted_pages(self) -> Tuple[discord.Embed, ...]:
+        if self._formatted_pages is not None:
+            return self._formatted_pages
+
+        pages = []
+        total = len(self.pages)
+        for i, page in enumerate(self.pages):
+            counter = f"({i+1}/{total})"
+            text = page.footer.text
+            if text != _EMPTY and (text == counter or text.endswith(f" - {counter}")):
+                pages.append(page)  # footer is already formatted
+                continue
+
+            footer = {"text": counter}
+            if text != _EMPTY:
+                footer["text"] = f"{text} - {counter}"
+                if page.footer.icon_url != _EMPTY:
+                    footer["icon_url"] = page.footer.icon_url
+
+            # build a new embed so the original page stays untouched
+            pages.append(discord.Embed.from_dict({**page.to_dict(), "footer": footer}))
+
+        self._formatted_pages = tuple(pages)
+        return self._formatted_pages
+
+    async def run(
+        self,
+        users: Union[List[discord.User], Set[int]],
+        channel: discord.TextChannel = None,
+        timeout: float = 100,
+    ):
         """
         Runs the paginator.
 
-        :type users: List[discord.User]
+        :type users: Union[List[discord.User], Set[int]]
         :param users:
-            A list of :class:`discord.User` that can control the pagination.
+            A list of :class:`discord.User` or a set of user ids that can control the
+            pagination.
             Passing an empty list will grant access to all users. (Not recommended.)
 
         :type channel: Optional[discord.TextChannel]
@@ -70,6 +143,10 @@ class EmbedPaginator(Dialog):
             The text channel to send the embed to.
             Must only be specified if `self.message` is `None`.
 
+        :type timeout: float
+        :param timeout:
+            Seconds to wait for a reaction before the paginator stops.
+
         :return: None
         """
 
@@ -78,79 +155,188 @@ class EmbedPaginator(Dialog):
         elif channel is None:
             raise TypeError("Missing argument. You need to specify a target channel.")
 
+        is_private = isinstance(
+            channel, (discord.channel.DMChannel, discord.channel.GroupChannel)
+        )
+
         self._embed = self.pages[0]
 
         if len(self.pages) == 1:  # no pagination needed in this case
             self.message = await channel.send(embed=self._embed)
             return
 
-        self.message = await channel.send(embed=self.formatted_pages[0])
+        pages = self._get_formatted_pages()
+        self.message = msg = await channel.send(embed=pages[0])
         current_page_index = 0
 
         for emoji in self.control_emojis:
-            await self.message.add_reaction(emoji)
+            await msg.add_reaction(emoji)
 
-        def check(r: discord.Reaction, u: discord.User):
-            res = (r.message.id == self.message.id) and (r.emoji in self.control_emojis)
+        # the message is not replaced from here on, so its members can be bound
+        edit, remove = msg.edit, msg.remove_reaction
+        message_id = msg.id
+        deltas = self._deltas
+        stop_emoji = self._stop_emoji
+        control_emoji_set = self._control_emoji_set
+        allowed_ids = self._get_allowed_ids(users)
 
-            if len(users) > 0:
-                res = res and u.id in [u1.id for u1 in users]
+        def check(payload: discord.RawReactionActionEvent):
+            return (
+                payload.message_id == message_id
+                and str(payload.emoji) in control_emoji_set
+                and (allowed_ids is None or payload.user_id in allowed_ids)
+            )
 
-            return res
+        max_index = len(pages) - 1  # index for the last page
 
         while True:
-            try:
-                reaction, user = await self._client.wait_for(
-                    "reaction_add", check=check, timeout=timeout
-                )
-            except asyncio.TimeoutError:
-                if not isinstance(
-                    channel, discord.channel.DMChannel
-                ) and not isinstance(channel, discord.channel.GroupChannel):
+            payload = await self._wait_for_reaction(check, timeout)
+            if payload is None:
+                if not is_private:
                     try:
-                        await self.message.clear_reactions()
+                        await msg.clear_reactions()
                     except discord.Forbidden:
                         pass
                 return
 
-            emoji = reaction.emoji
-            max_index = len(self.pages) - 1  # index for the last page
-
-            if emoji == self.control_emojis[0]:
-                load_page_index = 0
+            emoji = str(payload.emoji)
 
-            elif emoji == self.control_emojis[1]:
-                load_page_index = (
-                    current_page_index - 1
-                    if current_page_index > 0
-                    else current_page_index
-                )
+            if emoji == stop_emoji:
+                await msg.delete()
+                return
 
-            elif emoji == self.control_emojis[2]:
-                load_page_index = (
-                    current_page_index + 1
-                    if current_page_index < max_index
-                    else current_page_index
-                )
+            # coalesce rapid clicks into a single page change
+            load_page_index, drained, stopped = await self._drain_pending(
+                check,
+                deltas,
+                stop_emoji,
+                deltas[emoji](current_page_index, max_index),
+                max_index,
+            )
+
+            if stopped:
+                await msg.delete()
+                return
 
-            elif emoji == self.control_emojis[3]:
-                load_page_index = max_index
+            to_remove = () if is_private else (payload, *drained)
+            removals = asyncio.gather(
+                *(remove(p.emoji, discord.Object(id=p.user_id)) for p in to_remove),
+                return_exceptions=True,
+            )
 
+            # edit and remove_reaction hit different rate-limit buckets
+            if load_page_index != current_page_index:
+                _, results = await asyncio.gather(
+                    edit(embed=pages[load_page_index]), removals
+                )
             else:
-                await self.message.delete()
-                return
+                results = await removals
 
-            await self.message.edit(embed=self.formatted_pages[load_page_index])
-            if not isinstance(channel, discord.channel.DMChannel) and not isinstance(
-                channel, discord.channel.GroupChannel
-            ):
-                try:
-                    await self.message.remove_reaction(reaction, user)
-                except discord.Forbidden:
-                    pass
+            # only a missing permission to remove reactions is ignored
+            for result in results:
+                if isinstance(result, BaseException) and not isinstance(
+                    result, discord.Forbidden
+                ):
+                    raise result
 
             current_page_index = load_page_index
 
+    @staticmethod
+    def _get_allowed_ids(
+        users: Union[List[discord.User], Set[int]]
+    ) -> Optional[FrozenSet[int]]:
+        """
+        :return: the ids of ``users``, or ``None`` if any user is allowed
+        """
+
+        if not users:
+            return None
+
+        if isinstance(next(iter(users)), int):
+            return frozenset(users)
+
+        return frozenset(u.id for u in users)
+
+    async def _wait_for_reaction(
+        self, check, timeout: float
+    ) -> Optional[discord.RawReactionActionEvent]:
+        """
+        Wait for a reaction matching ``check``.
+
+        :return: the reaction payload, or ``None`` if ``timeout`` ran out
+        """
+
+        # The payload is stored in a future owned here as soon as the listener accepts
+        # it, so a reaction accepted right at the deadline isn't lost by cancelling
+        # the wait_for task. Once given up, the listener stops accepting reactions.
+        received = self._client.loop.create_future()
+
+        def accept(payload: discord.RawReactionActionEvent):
+            if received.done() or not check(payload):
+                return False
+
+            received.set_result(payload)
+            return True
+
+        listener = asyncio.ensure_future(
+            self._client.wait_for("raw_reaction_add", check=accept)
+        )
+        try:
+            await asyncio.wait({received}, timeout=timeout)
+        finally:
+            # also runs when the caller is cancelled, so the listener never leaks
+            if not received.done():
+                received.cancel()
+            listener.cancel()
+
+        if received.cancelled():
+            return None
+
+        return received.result()
+
+    async def _drain_pending(
+        self,
+        check,
+        deltas: Dict[str, Callable[[int, int], int]],
+        stop_emoji: str,
+        index: int,
+        max_index: int,
+        timeout_ms: int = 75,
+        max_wait_ms: int = 500,
+    ) -> Tuple[int, List[discord.RawReactionActionEvent], bool]:
+        """
+        Collect reactions that arrive in quick succession and apply them to ``index``.
+
+        Stops once no reaction arrived for ``timeout_ms`` or after ``max_wait_ms`` in
+        total, so a steady stream of reactions can't hold back the page change.
+
+        :return: the resulting page index, the collected reaction payloads and
+            whether the stop emoji was among them
+        """
+
+        loop = self._client.loop
+        deadline = loop.time() + max_wait_ms / 1000
+
+        payloads = []
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return index, payloads, False
+
+            payload = await self._wait_for_reaction(
+                check, min(timeout_ms / 1000, remaining)
+            )
+            if payload is None:
+                return index, payloads, False
+
+            payloads.append(payload)
+            emoji = str(payload.emoji)
+
+            if emoji == stop_emoji:
+                return index, payloads, True
+
+            index = deltas[emoji](index, max_index)
+
     @staticmethod
     def generate_sub_lists(origin_list: list, max_len: int = 25) -> List[list]:
         """
@@ -176,26 +362,16 @@ class EmbedPaginator(Dialog):
         :rtype: ``List[list]``
         """
 
-        if len(origin_list) > max_len:
-            sub_lists = []
-
-            while len(origin_list) > max_len:
-                sub_lists.append(origin_list[:max_len])
-                del origin_list[:max_len]
-
-            sub_lists.append(origin_list)
-
-        else:
-            sub_lists = [origin_list]
-
-        return sub_lists
+        return [
+            origin_list[i : i + max_len] for i in range(0, len(origin_list), max_len)
+        ] or [[]]
 
 
 class BotEmbedPaginator(EmbedPaginator):
     def __init__(
         self,
         ctx: commands.Context,
-        pages: [discord.Embed],
+        pages: Sequence[discord.Embed],
         message: discord.Message = None,
         *,
         control_emojis: Tuple[str, str, str, str, str] = None,
@@ -204,7 +380,7 @@ class BotEmbedPaginator(EmbedPaginator):
         Initialize a new EmbedPaginator.
 
         :param ctx: The :class:`discord.ext.commands.Context` to use.
-        :param pages: A list of :class:`discord.Embed` to paginate through.
+        :param pages: A sequence of :class:`discord.Embed` to paginate through.
         :param message: An optional :class:`discord.Message` to edit.
             Otherwise a new message will be sent.
         """
@@ -215,7 +391,10 @@ class BotEmbedPaginator(EmbedPaginator):
         )
 
     async def run(
-        self, channel: discord.TextChannel = None, users: List[discord.User] = None
+        self,
+        channel: discord.TextChannel = None,
+        users: Union[List[discord.User], Set[int]] = None,
+        timeout: float = 100,
     ):
         """
         Runs the paginator.
@@ -225,19 +404,24 @@ class BotEmbedPaginator(EmbedPaginator):
             The text channel to send the embed to.
             Default is the context channel.
 
-        :type users: Optional[List[discord.User]]
+        :type users: Optional[Union[List[discord.User], Set[int]]]
         :param users:
-            A list of :class:`discord.User` that can control the pagination.
+            A list of :class:`discord.User` or a set of user ids that can control the
+            pagination.
             Default is the context author.
             Passing an empty list will grant access to all users. (Not recommended.)
 
+        :type timeout: float
+        :param timeout:
+            Seconds to wait for a reaction before the paginator stops.
+
         :return: None
         """
 
         if users is None:
-            users = [self._ctx.author]
+            users = {self._ctx.author.id}
 
         if self.message is None and channel is None:
             channel = self._ctx.channel
 
-        await super().run(users, channel)
+        await super().run(users, channel, timeout=timeout)
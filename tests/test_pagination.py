@@ -0,0 +1,300 @@
+import asyncio
+import discord
+import pytest
+from types import SimpleNamespace
+from disputils import EmbedPaginator
+
+
+def test_generate_sub_lists():
+    origin = list(range(7))
+
+    assert EmbedPaginator.generate_sub_lists(origin, 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert origin == list(range(7))  # the given list is left untouched
+
+
+def test_generate_sub_lists_short():
+    assert EmbedPaginator.generate_sub_lists([1, 2]) == [[1, 2]]
+    assert EmbedPaginator.generate_sub_lists([]) == [[]]
+
+
+def _footers(pages):
+    return [page.to_dict().get("footer") for page in pages]
+
+
+def test_formatted_pages_footers():
+    empty = discord.Embed(title="a")
+    text = discord.Embed(title="b").set_footer(text="foot")
+    text_icon = discord.Embed(title="c").set_footer(text="foot", icon_url="http://i")
+    icon = discord.Embed(title="d").set_footer(icon_url="http://i")
+    pages = [empty, text, text_icon, icon]
+
+    paginator = EmbedPaginator(None, pages)
+
+    assert _footers(paginator.formatted_pages) == [
+        {"text": "(1/4)"},
+        {"text": "foot - (2/4)"},
+        {"text": "foot - (3/4)", "icon_url": "http://i"},
+        {"text": "(4/4)"},
+    ]
+    # the original embeds are left untouched
+    assert _footers(pages) == [
+        None,
+        {"text": "foot"},
+        {"text": "foot", "icon_url": "http://i"},
+        {"icon_url": "http://i"},
+    ]
+
+
+def test_formatted_pages_already_formatted():
+    first = discord.Embed(title="a").set_footer(text="(1/2)")
+    second = discord.Embed(title="b").set_footer(text="foot - (2/2)")
+
+    formatted = EmbedPaginator(None, [first, second]).formatted_pages
+
+    assert formatted[0] is first
+    assert formatted[1] is second
+    assert _footers(formatted) == [{"text": "(1/2)"}, {"text": "foot - (2/2)"}]
+
+
+def test_allowed_ids():
+    users = [discord.Object(id=1), discord.Object(id=2)]
+
+    assert EmbedPaginator._get_allowed_ids(users) == frozenset({1, 2})
+    assert EmbedPaginator._get_allowed_ids({1, 2}) == frozenset({1, 2})
+    assert EmbedPaginator._get_allowed_ids([]) is None
+
+
+class _Client:
+    """ Mimics how discord.py resolves ``wait_for`` listeners on dispatch. """
+
+    def __init__(self):
+        self.listeners = []
+
+    @property
+    def loop(self):
+        return asyncio.get_event_loop()
+
+    async def wait_for(self, event, *, check):
+        future = self.loop.create_future()
+        self.listeners.append((future, check))
+        return await future
+
+    def dispatch(self, payload):
+        for listener in list(self.listeners):
+            future, check = listener
+            if future.cancelled():
+                self.listeners.remove(listener)
+            elif check(payload):
+                future.set_result(payload)
+                self.listeners.remove(listener)
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_wait_for_reaction():
+    client = _Client()
+    paginator = EmbedPaginator(client, [])
+
+    async def main():
+        waiter = asyncio.ensure_future(paginator._wait_for_reaction(bool, 1))
+        while not client.listeners:
+            await asyncio.sleep(0)
+        client.dispatch("payload")
+        return await waiter
+
+    assert _run(main()) == "payload"
+
+
+def test_wait_for_reaction_timeout():
+    client = _Client()
+    paginator = EmbedPaginator(client, [])
+    checked = []
+
+    async def main():
+        result = await paginator._wait_for_reaction(checked.append, 0.01)
+        client.dispatch("late")  # must not be consumed after giving up
+        await asyncio.sleep(0)
+        return result
+
+    assert _run(main()) is None
+    assert checked == []
+    assert client.listeners == []
+
+
+def test_wait_for_reaction_cancelled():
+    client = _Client()
+    paginator = EmbedPaginator(client, [])
+    checked = []
+
+    async def main():
+        waiter = asyncio.ensure_future(paginator._wait_for_reaction(checked.append, 1))
+        while not client.listeners:
+            await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.wait({waiter})
+        await asyncio.sleep(0)
+        client.dispatch("late")  # must not be consumed after being cancelled
+        return waiter
+
+    assert _run(main()).cancelled()
+    assert checked == []
+    assert client.listeners == []
+
+
+def _forbidden():
+    return discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "")
+
+
+class _Message:
+    """ Records the requests a paginator makes on its message. """
+
+    id = 1
+
+    def __init__(self):
+        self.log = []
+        self.edit_error = None
+        self.remove_error = None
+
+    async def add_reaction(self, emoji):
+        pass
+
+    async def edit(self, *, embed):
+        if self.edit_error is not None:
+            raise self.edit_error
+        self.log.append(("edit", embed.footer.text))
+
+    async def remove_reaction(self, emoji, member):
+        if self.remove_error is not None:
+            raise self.remove_error
+        self.log.append(("remove", str(emoji), member.id))
+
+    async def clear_reactions(self):
+        self.log.append(("clear",))
+
+    async def delete(self):
+        self.log.append(("delete",))
+
+
+class _Channel:
+    def __init__(self, message):
+        self.message = message
+
+    async def send(self, *, embed):
+        return self.message
+
+
+def _reaction(emoji, user_id=5):
+    return SimpleNamespace(
+        emoji=discord.PartialEmoji(name=emoji), message_id=1, user_id=user_id
+    )
+
+
+async def _until(predicate):
+    for _ in range(1000):
+        if predicate():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not reached")
+
+
+def _listening(client):
+    return lambda: any(not future.done() for future, _ in client.listeners)
+
+
+def _paginate(*reactions, timeout=0.3, **errors):
+    """
+    Run a three page paginator and dispatch each reaction once it is being waited
+    for. ``None`` waits for the paginator to act on the reactions so far.
+    """
+
+    client = _Client()
+    message = _Message()
+    for name, error in errors.items():
+        setattr(message, name, error)
+
+    pages = [discord.Embed(title=str(i)) for i in range(3)]
+    paginator = EmbedPaginator(client, pages)
+
+    async def main():
+        run = asyncio.ensure_future(paginator.run([], _Channel(message), timeout))
+        for reaction in reactions:
+            if reaction is None:
+                await _until(lambda: message.log)
+            else:
+                await _until(_listening(client))
+                client.dispatch(_reaction(reaction))
+        await run
+
+    _run(main())
+    return message.log
+
+
+def test_run_edit_error_is_raised():
+    with pytest.raises(discord.Forbidden):
+        _paginate("▶", edit_error=_forbidden())
+
+
+def test_run_ignores_forbidden_removal():
+    assert _paginate("▶", remove_error=_forbidden()) == [
+        ("edit", "(2/3)"),
+        ("clear",),
+    ]
+
+
+def test_drain_pending_is_capped():
+    client = _Client()
+    paginator = EmbedPaginator(client, [])
+
+    async def feed():
+        while True:
+            await _until(_listening(client))
+            client.dispatch(_reaction("▶"))
+            await asyncio.sleep(0.01)
+
+    async def main():
+        feeder = asyncio.ensure_future(feed())
+        start = client.loop.time()
+        result = await paginator._drain_pending(
+            bool, paginator._deltas, paginator._stop_emoji, 0, 99, max_wait_ms=100
+        )
+        feeder.cancel()
+        await asyncio.wait({feeder})
+        return result, client.loop.time() - start
+
+    (index, payloads, stopped), elapsed = _run(main())
+
+    assert elapsed < 0.3
+    assert not stopped
+    assert index == len(payloads) > 0
+
+
+def test_run_coalesces_burst():
+    log = _paginate("▶", "▶")
+
+    assert sorted(log) == sorted(
+        [("edit", "(3/3)"), ("remove", "▶", 5), ("remove", "▶", 5), ("clear",)]
+    )
+
+
+def test_run_stop_in_burst():
+    assert _paginate("▶", "⏹") == [("delete",)]
+
+
+def test_run_unchanged_page_skips_edit():
+    assert _paginate("◀") == [("remove", "◀", 5), ("clear",)]
+
+
+def test_run_separate_clicks():
+    log = _paginate("▶", None, "⏭")
+
+    assert [entry for entry in log if entry[0] == "edit"] == [
+        ("edit", "(2/3)"),
+        ("edit", "(3/3)"),
+    ]